@@ -28,17 +28,22 @@ Notes
 - Transparent background uses Windows-specific Tk attribute '-transparentcolor'.
 """
 
+import collections
+import functools
 import json
+import logging
 import os
 import queue
 import threading
 import time
-from dataclasses import dataclass, asdict, replace
+from dataclasses import dataclass
 from typing import Literal, Any, Dict
 
 import tkinter as tk
 from tkinter import ttk, colorchooser, messagebox
 
+log = logging.getLogger("auratrac")
+
 # Third-party deps: keyboard, mouse
 try:
     import keyboard  # type: ignore
@@ -47,7 +52,7 @@ try:
 except ImportError:
     HOOK_AVAILABLE = False
     mouse = None  # type: ignore
-    print("Warning: 'keyboard' and 'mouse' modules not found. Tracking will be disabled.")
+    log.warning("Warning: 'keyboard' and 'mouse' modules not found. Tracking will be disabled.")
 
 
 MOUSE_DOWN_EVENT_TYPES = {"down", "double", "triple"}
@@ -57,6 +62,34 @@ if HOOK_AVAILABLE:
         if isinstance(value, str):
             MOUSE_DOWN_EVENT_TYPES.add(value)
 
+# Tracked mouse input codes -> button names reported by the `mouse` library
+MOUSE_BUTTON_MAP: Dict[int, str] = {}
+if HOOK_AVAILABLE:
+    MOUSE_BUTTON_MAP = {1: mouse.LEFT, 2: mouse.MIDDLE, 3: mouse.RIGHT, 4: 'x', 5: 'x2'}
+
+# Same-direction wheel steps closer together than this are treated as one
+# (filters cheap-wheel double fires without dropping high-resolution detents)
+SCROLL_COALESCE_NS = 20_000_000
+
+# Tracked mouse input codes -> display names
+MOUSE_INPUT_NAMES: Dict[int, str] = {
+    1: "Left Click",
+    2: "Middle Click",
+    3: "Right Click",
+    4: "Thumb 1 (Back)",
+    5: "Thumb 2 (Forward)",
+    10: "Scroll Wheel Up",
+    11: "Scroll Wheel Down",
+}
+
+
+# Virtual event the core raises on the Tk root whenever it queues something for the UI
+CORE_UPDATE_EVENT = "<<AuraUpdate>>"
+
+
+# Non-Windows hooks generally need root; resolved once at import
+NEEDS_ROOT_WARNING = os.name != 'nt' and hasattr(os, "getuid") and os.getuid() != 0
+
 
 # --- Configuration and Persistence ---
 CONFIG_FILE = "auratrac_lite.json"
@@ -72,7 +105,21 @@ TEXT_COLOR = "#E2E8F0"
 SUBTEXT_COLOR = "#94A3B8"
 BORDER_COLOR = "#1E293B"
 
-@dataclass
+# --- Fonts (shared tuples, built once) ---
+FONT_FAMILY = "Inter"
+FONT_SMALL = (FONT_FAMILY, 9)
+FONT_BODY = (FONT_FAMILY, 10)
+FONT_BODY_BOLD = (FONT_FAMILY, 10, "bold")
+FONT_CARD_TITLE = (FONT_FAMILY, 11, "bold")
+FONT_HEADER = (FONT_FAMILY, 15, "bold")
+
+
+def _overlay_font(size: int, is_bold: bool) -> tuple[str, int, str]:
+    """Font tuple for the overlay counter."""
+    return (FONT_FAMILY, size, "bold" if is_bold else "normal")
+
+
+@dataclass(slots=True)
 class Settings:
     # Tracking
     input_type: Literal["keyboard", "mouse"] = "keyboard"
@@ -98,10 +145,22 @@ class Settings:
     is_paused: bool = False
     count: int = 0
 
-# --- Utility Function for Key Name ---
 
-SCAN_CODE_NAME_CACHE: Dict[int, str] = {}
+# Settings fields written to CONFIG_FILE (volatile runtime state is excluded)
+SAVE_FIELDS = (
+    "input_type", "input_code", "input_display", "is_rapid_mode", "amount", "burst_idle_ms",
+    "font_size", "text_color", "bg_color", "is_bold", "is_transparent", "opacity",
+)
 
+DEFAULT_SETTINGS = Settings()  # read-only reference instance
+
+# Persisted field -> (expected type, default), used to validate CONFIG_FILE
+SETTINGS_SCHEMA: Dict[str, tuple[type, Any]] = {
+    name: (type(getattr(DEFAULT_SETTINGS, name)), getattr(DEFAULT_SETTINGS, name))
+    for name in SAVE_FIELDS
+}
+
+# --- Utility Function for Key Name ---
 
 def _format_key_name(name: str) -> str:
     """Normalizes key names for display purposes."""
@@ -112,18 +171,15 @@ def _format_key_name(name: str) -> str:
     return name.replace("_", " ").title()
 
 
+@functools.lru_cache(maxsize=512)
 def get_key_name_from_scan_code(scan_code: int) -> str:
-    """Safely converts a keyboard scan code to a readable key name."""
+    """Safely converts a keyboard scan code to a readable key name (memoized)."""
     if not HOOK_AVAILABLE:
         return f"Code {scan_code}"
-    if scan_code in SCAN_CODE_NAME_CACHE:
-        return SCAN_CODE_NAME_CACHE[scan_code]
     try:
         name = keyboard.get_key_name(scan_code)
         if name:
-            formatted = _format_key_name(name)
-            SCAN_CODE_NAME_CACHE[scan_code] = formatted
-            return formatted
+            return _format_key_name(name)
     except Exception:
         pass
 
@@ -139,15 +195,11 @@ def get_key_name_from_scan_code(scan_code: int) -> str:
                 except (AttributeError, ValueError):
                     continue
                 if scan_code in scan_codes:
-                    formatted = _format_key_name(key_name)
-                    SCAN_CODE_NAME_CACHE[scan_code] = formatted
-                    return formatted
+                    return _format_key_name(key_name)
     except Exception:
         pass
 
-    fallback = f"Code {scan_code}"
-    SCAN_CODE_NAME_CACHE[scan_code] = fallback
-    return fallback
+    return f"Code {scan_code}"
 
 
 # --- Core Logic (Runs in a separate thread) ---
@@ -157,192 +209,271 @@ class CounterCore(threading.Thread):
         super().__init__(daemon=True)
         self.settings = settings
         self.count = settings.count
-        self.is_running = True
+        self._stop_event = threading.Event()
         
         # Communication queues
-        self.update_q = queue.Queue() # For sending count/status updates to UI
-        self.event_q = queue.Queue()  # For receiving events (quit/hotkeys)
+        # For sending count/status updates to UI. Nobody blocks on it, so a
+        # deque (atomic append/popleft) is enough.
+        self.update_q: collections.deque[tuple[str, Any]] = collections.deque()
+        self.event_q = queue.Queue()  # For receiving events (quit/hotkeys, input capture)
         self.setting_q = queue.Queue() # For receiving new settings from UI
+        self._tk_root: tk.Misc | None = None  # Set via attach_root(); receives CORE_UPDATE_EVENT
+        # At most one CORE_UPDATE_EVENT is queued on the Tk side at a time;
+        # hook threads only cross into Tk again once the UI has drained.
+        self._notify_lock = threading.Lock()
+        self._notify_pending = False
 
         # State management for Burst/Group Mode
         self.sequence_presses = 0
-        self.last_press_time = 0.0
+        self.last_press_time = 0  # time.monotonic_ns(); 0 = no press yet
         self.burst_count_tracker = 0
 
-        # Scroll Wheel Debounce State
-        self.last_scroll_time = 0.0
-        self.scroll_debounce_ms = 100
+        # Scroll Wheel Coalescing State
+        self.last_scroll_time = 0  # time.monotonic_ns() of the last counted wheel step
 
         # Hooks
         self.key_hook: Any = None
         self.mouse_hook: Any = None
-        self._pressed_keys: set[int] = set()
-        self._setup_hooks()
+        self._hotkey_handles: list[Any] = []
+        self._key_held = False
+        self._hooked_input: tuple[str, int] | None = None
+
+        # Per-input dispatch targets, resolved once in _setup_hooks so the
+        # global hook callbacks don't re-derive them on every event.
+        self._key_down: Any = None
+        self._target_mouse_button: Any = None
+        self._wheel_direction = 0  # +1 = scroll up, -1 = scroll down, 0 = wheel not tracked
+
+        # Press handler for the current counting mode (see _refresh_dispatch)
+        self._handle_input_impl = self._handle_rapid
+        self._burst_idle_ns = 0
+        self._refresh_dispatch()
+        # Hook/hotkey installation is deferred to the core thread (see
+        # _deferred_init) so constructing the core stays cheap.
+
+    @property
+    def is_running(self) -> bool:
+        return not self._stop_event.is_set()
+
+    def attach_root(self, root: tk.Misc):
+        self._tk_root = root
+
+    def ack_notify(self):
+        """Called by the UI before it drains the queues; re-arms _notify_ui."""
+        with self._notify_lock:
+            self._notify_pending = False
+
+    def _notify_ui(self):
+        root = self._tk_root
+        if root is None:
+            return
+        with self._notify_lock:
+            if self._notify_pending:
+                return  # an event is already queued; its drain will pick this up
+            self._notify_pending = True
+        try:
+            # Marshalled onto the Tk thread by tkinter; wakes the UI only when there is work.
+            root.event_generate(CORE_UPDATE_EVENT, when="tail")
+        except (RuntimeError, tk.TclError):
+            # main loop not running (startup/shutdown); the UI's fallback poll catches up
+            self.ack_notify()
+
+    def _post_update(self, update_type: str, value: Any):
+        self.update_q.append((update_type, value))
+        self._notify_ui()
+
+    def post_event(self, event: str | tuple[Any, ...]):
+        """Queues an event for the UI and wakes it; safe to call from any thread."""
+        self.event_q.put(event)
+        self._notify_ui()
 
     def _update_count(self, delta: int):
         if not self.settings.is_paused:
             self.count += delta
-            self.update_q.put(("count", self.count))
+            self._post_update("count", self.count)
 
-    def _handle_input(self):
-        current_time = time.time() * 1000  # ms
-        
-        # 1. RAPID MODE
+    def _refresh_dispatch(self):
+        """Picks the press handler for the current mode; call after every settings change."""
         if self.settings.is_rapid_mode:
+            self._handle_input_impl = self._handle_rapid
+        elif self.settings.burst_idle_ms == 0:
+            self._handle_input_impl = self._handle_multi_click
+        elif self.settings.amount == 1:
+            self._handle_input_impl = self._handle_burst
+        else:
+            self._handle_input_impl = self._handle_multi_burst
+        self._burst_idle_ns = self.settings.burst_idle_ms * 1_000_000
+
+    # 1. RAPID MODE: every press = +1. Deliberately posts no status or
+    # sequence updates, which would only bloat the queue at high input rates.
+    def _handle_rapid(self):
+        self._update_count(1)
+
+    # 2. MULTI-CLICK (Idle=0): +1 every N presses
+    def _handle_multi_click(self):
+        self.sequence_presses += 1
+        if self.sequence_presses % self.settings.amount == 0:
             self._update_count(1)
-            self.last_press_time = current_time 
-            self.sequence_presses = 0 
-            self.burst_count_tracker = 0
-            self.update_q.put(("status", "Rapid Mode: +1"))
-            return
+            self._post_update("status", f"Multi-Click Count ({self.settings.amount} met)")
+        self._post_update("sequence_presses", self.sequence_presses)
+
+    def _advance_sequence(self):
+        """Counts a press towards the current sequence, starting a new one after the idle time."""
+        current_time = time.monotonic_ns()
+        if self.last_press_time != 0 and current_time - self.last_press_time > self._burst_idle_ns:
+            if self.sequence_presses > 0:
+                self.burst_count_tracker += 1
+                self._post_update("status", f"Burst Completed ({self.burst_count_tracker}/{self.settings.amount})")
+            self.sequence_presses = 0
+        self.sequence_presses += 1
+        self.last_press_time = current_time
+
+    # 3. BURST (Idle>0, Amount=1): +1 on the first press of a sequence
+    def _handle_burst(self):
+        self._advance_sequence()
+        if self.sequence_presses == 1:
+            self._update_count(1)
+            self._post_update("status", "Burst Count (First Press)")
+        self._post_update("sequence_presses", self.sequence_presses)
 
-        # 2. BURST/GROUP MODE
-        idle_duration = current_time - self.last_press_time
-
-        # 2a. Sequence reset via idle time
-        if self.settings.burst_idle_ms > 0 and self.last_press_time != 0.0:
-            if idle_duration > self.settings.burst_idle_ms:
-                if self.sequence_presses > 0:
-                    self.burst_count_tracker += 1
-                    self.update_q.put(("status", f"Burst Completed ({self.burst_count_tracker}/{self.settings.amount})"))
-                self.sequence_presses = 0
-                
-        # 2b. Increment sequence and update time
-        self.sequence_presses += 1 
-        self.last_press_time = current_time 
-
-        # 3. Apply count logic
-        if self.settings.burst_idle_ms == 0:
-            # Multi-Click Count
-            if self.sequence_presses % self.settings.amount == 0:
-                self._update_count(1)
-                self.update_q.put(("status", f"Multi-Click Count ({self.settings.amount} met)"))
-        else:
-            if self.settings.amount == 1:
-                # Burst Count (first press of sequence)
-                if self.sequence_presses == 1:
-                    self._update_count(1)
-                    self.update_q.put(("status", "Burst Count (First Press)"))
-            elif self.settings.amount > 1:
-                # Multi-Burst: count on 1st press of Nth burst
-                if self.sequence_presses == 1 and self.burst_count_tracker >= self.settings.amount:
-                    self._update_count(1)
-                    self.update_q.put(("status", f"Multi-Burst Count ({self.settings.amount} bursts met)"))
-                    self.burst_count_tracker = 0
-
-        self.update_q.put(("sequence_presses", self.sequence_presses))
+    # 4. MULTI-BURST (Idle>0, Amount>1): +1 on the first press of the Nth sequence
+    def _handle_multi_burst(self):
+        self._advance_sequence()
+        if self.sequence_presses == 1 and self.burst_count_tracker >= self.settings.amount:
+            self._update_count(1)
+            self._post_update("status", f"Multi-Burst Count ({self.settings.amount} bursts met)")
+            self.burst_count_tracker = 0
+        self._post_update("sequence_presses", self.sequence_presses)
 
     def _key_callback(self, event):
-        event_type = event.event_type
-        scan_code = getattr(event, "scan_code", None)
-
-        if scan_code is None:
-            return
+        # Only called for the tracked scan code (see keyboard.hook_key in
+        # _setup_hooks); _setup_hooks() resets _key_held on input changes.
+        if event.event_type == self._key_down:
+            if not self._key_held:  # ignore auto-repeat
+                self._key_held = True
+                self._handle_input_impl()
+        else:
+            self._key_held = False
 
-        if scan_code == self.settings.input_code:
-            if event_type == keyboard.KEY_DOWN:
-                if scan_code not in self._pressed_keys:
-                    self._pressed_keys.add(scan_code)
-                    self._handle_input()
-            elif event_type == keyboard.KEY_UP:
-                self._pressed_keys.discard(scan_code)
-        elif event_type == keyboard.KEY_UP:
-            # Ensure we clear stale entries when switching inputs mid-press.
-            self._pressed_keys.discard(scan_code)
-        
     def _mouse_callback(self, event):
-        button_name_map = {
-            1: mouse.LEFT,
-            2: mouse.MIDDLE,
-            3: mouse.RIGHT,
-            4: 'x',
-            5: 'x2',
-        }
-        if isinstance(event, mouse.ButtonEvent) and event.event_type in MOUSE_DOWN_EVENT_TYPES:
-            target_button_name = button_name_map.get(self.settings.input_code)
-            if target_button_name and event.button == target_button_name:
-                self._handle_input()
-        elif isinstance(event, mouse.WheelEvent):
-            if (event.delta > 0 and self.settings.input_code == 10) or \
-               (event.delta < 0 and self.settings.input_code == 11):
-                current_time = time.time() * 1000
-                if current_time - self.last_scroll_time < self.scroll_debounce_ms:
+        if self._target_mouse_button is not None:
+            if isinstance(event, mouse.ButtonEvent) and event.button == self._target_mouse_button \
+               and event.event_type in MOUSE_DOWN_EVENT_TYPES:
+                self._handle_input_impl()
+        elif self._wheel_direction and isinstance(event, mouse.WheelEvent):
+            if event.delta * self._wheel_direction > 0:
+                # Only the tracked direction gets here, so a step arriving
+                # within the coalesce window is mechanical bounce, not a new detent.
+                current_time = time.monotonic_ns()
+                if current_time - self.last_scroll_time < SCROLL_COALESCE_NS:
                     return
                 self.last_scroll_time = current_time
-                self._handle_input()
+                self._handle_input_impl()
+
+    def _setup_hotkeys(self):
+        # Registered once for the lifetime of the core; settings changes only
+        # swap the tracking hook.
+        if not HOOK_AVAILABLE: return
+        self._hotkey_handles = [
+            keyboard.add_hotkey('-', lambda: self._update_count(-1)),
+            keyboard.add_hotkey('=', lambda: self._update_count(1)),
+            keyboard.add_hotkey('0', lambda: self.set_count(0)),
+            keyboard.add_hotkey('9', lambda: self.toggle_pause()),
+            keyboard.add_hotkey('delete', lambda: self.post_event("quit")),
+        ]
+
+    def _teardown_hotkeys(self):
+        if not HOOK_AVAILABLE: return
+        for handle in self._hotkey_handles:
+            try: keyboard.remove_hotkey(handle)
+            except (KeyError, ValueError): pass
+        self._hotkey_handles = []
 
     def _setup_hooks(self):
         if not HOOK_AVAILABLE: return
         self._teardown_hooks()
-        self._pressed_keys.clear()
+        self._key_held = False
+        self._hooked_input = (self.settings.input_type, self.settings.input_code)
 
-        # Global hotkeys
-        keyboard.add_hotkey('-', lambda: self._update_count(-1))
-        keyboard.add_hotkey('=', lambda: self._update_count(1))
-        keyboard.add_hotkey('0', lambda: self.set_count(0))
-        keyboard.add_hotkey('9', lambda: self.toggle_pause())
-        keyboard.add_hotkey('delete', lambda: self.event_q.put("quit"))
+        code = self.settings.input_code
+        is_keyboard = self.settings.input_type == "keyboard"
+        self._key_down = keyboard.KEY_DOWN
+        self._target_mouse_button = None if is_keyboard else MOUSE_BUTTON_MAP.get(code)
+        self._wheel_direction = 0 if is_keyboard else {10: 1, 11: -1}.get(code, 0)
 
         # Tracking hook
         if self.settings.input_type == "keyboard":
-            self.key_hook = keyboard.hook(self._key_callback)
+            # hook_key filters by scan code inside the library, so other
+            # keystrokes never reach our Python callback. Key-up events are
+            # still delivered, which the auto-repeat guard relies on.
+            self.key_hook = keyboard.hook_key(code, self._key_callback)
             key_name = self.settings.input_display
             if not key_name:
                 key_name = get_key_name_from_scan_code(self.settings.input_code)
                 self.settings.input_display = key_name
-            self.update_q.put(("status", f"Tracking Key: {key_name}"))
+            self._post_update("status", f"Tracking Key: {key_name}")
         elif self.settings.input_type == "mouse":
             self.mouse_hook = mouse.hook(self._mouse_callback)
-            mouse_btn_name_map = {
-                1: "Left Click", 2: "Middle Click", 3: "Right Click",
-                4: "Thumb 1 (Back)", 5: "Thumb 2 (Forward)",
-                10: "Scroll Wheel Up", 11: "Scroll Wheel Down"
-            }
-            mouse_btn_name = mouse_btn_name_map.get(self.settings.input_code, self.settings.input_display or 'Unknown')
+            mouse_btn_name = MOUSE_INPUT_NAMES.get(self.settings.input_code, self.settings.input_display or 'Unknown')
             self.settings.input_display = mouse_btn_name
-            self.update_q.put(("status", f"Tracking Mouse: {mouse_btn_name}"))
+            self._post_update("status", f"Tracking Mouse: {mouse_btn_name}")
 
     def _teardown_hooks(self):
+        # Only remove the tracking hooks we own; unhook_all() would also drop
+        # the hotkeys and any capture hook the control panel has installed.
         if not HOOK_AVAILABLE: return
-        keyboard.unhook_all()
         if self.key_hook:
             try: keyboard.unhook(self.key_hook)
-            except ValueError: pass
+            except (KeyError, ValueError): pass
             self.key_hook = None
         if self.mouse_hook:
             try: mouse.unhook(self.mouse_hook)
             except ValueError: pass
             self.mouse_hook = None
 
+    def _deferred_init(self):
+        self._setup_hotkeys()
+        self._setup_hooks()
+
     def run(self):
-        self.update_q.put(("status", "Core started. Waiting for input..."))
-        while self.is_running:
+        self._deferred_init()
+        self._post_update("status", "Core started. Waiting for input...")
+        # Hook callbacks run on the keyboard/mouse library threads, so this
+        # thread only needs to wake up when the UI pushes new settings.
+        while not self._stop_event.is_set():
             try:
-                new_settings = self.setting_q.get_nowait()
-                self.settings = new_settings
-                self.count = new_settings.count
-                self.sequence_presses = 0
-                self.burst_count_tracker = 0
-                self._setup_hooks()
-                self.update_q.put(("count", self.count))
-                self.update_q.put(("paused", self.settings.is_paused))
+                new_settings = self.setting_q.get(timeout=0.5)
             except queue.Empty:
-                pass
-            time.sleep(0.01)
+                continue
+            if new_settings is None:  # stop() sentinel
+                break
+            self.settings = new_settings
+            self.sequence_presses = 0
+            self.burst_count_tracker = 0
+            self._refresh_dispatch()
+            # Only rebuild the native hooks when the tracked input changed;
+            # style/mode edits don't need a teardown. Compared against what the
+            # hooks were built for, since the UI shares (and mutates) the same
+            # Settings object.
+            if (self.settings.input_type, self.settings.input_code) != self._hooked_input:
+                self._setup_hooks()
+            self._post_update("paused", self.settings.is_paused)
 
     def stop(self):
-        self.is_running = False
+        self._stop_event.set()
+        self.setting_q.put(None)  # wake run() so it exits promptly
         self._teardown_hooks()
+        self._teardown_hotkeys()
 
     def set_count(self, new_count: int):
         self.count = new_count
-        self.update_q.put(("count", self.count))
+        self._post_update("count", self.count)
         self.sequence_presses = 0
         self.burst_count_tracker = 0
 
     def toggle_pause(self):
         self.settings.is_paused = not self.settings.is_paused
-        self.update_q.put(("paused", self.settings.is_paused))
+        self._post_update("paused", self.settings.is_paused)
         
     def update_settings(self, new_settings: Settings):
         self.setting_q.put(new_settings)
@@ -361,11 +492,12 @@ class Overlay(tk.Toplevel):
         self.overrideredirect(True)
         self.wm_attributes("-topmost", True)
 
-        self.count_var = tk.StringVar(value=str(settings.count))
+        self._last_rendered = str(settings.count)
+        self._applied_style: Dict[str, Any] = {}  # last values sent to Tk by apply_style()
         self.count_label = tk.Label(
             self, 
-            textvariable=self.count_var,
-            font=("Inter", settings.font_size, "bold" if settings.is_bold else "normal"),
+            text=self._last_rendered,
+            font=_overlay_font(settings.font_size, settings.is_bold),
             fg=settings.text_color,
             bg=settings.bg_color,
             bd=0,
@@ -373,17 +505,26 @@ class Overlay(tk.Toplevel):
             pady=5
         )
         self.count_label.pack(expand=True, fill=tk.BOTH)
+        # Set the text with a raw Tcl call on the cached widget path; this
+        # skips the configure() wrapper's option munging on every update.
+        self._tk_call = self.tk.call
+        self._count_path = str(self.count_label)
 
         # --- make overlay draggable ---
         self._drag_off_x = 0
         self._drag_off_y = 0
-        for widget in (self, self.count_label):
-            widget.bind("<ButtonPress-1>", self._start_drag)
-            widget.bind("<B1-Motion>", self._do_drag)
-            widget.bind("<ButtonRelease-1>", self._end_drag)
+        # The label fills the whole window, so binding it alone covers the
+        # hit area; binding the Toplevel as well fired every handler twice.
+        self.count_label.bind("<ButtonPress-1>", self._start_drag, add="+")
+        self.count_label.bind("<B1-Motion>", self._do_drag, add="+")
+        self.count_label.bind("<ButtonRelease-1>", self._end_drag, add="+")
 
         self.apply_style()
-        self.after(100, self._poll_core_updates)
+        # The label fills the window, and a Label's requested size is computed
+        # as soon as it is configured, so this needs no geometry pass.
+        self.width = self.count_label.winfo_reqwidth()  # initial window width, for layout
+        master.bind(CORE_UPDATE_EVENT, self._drain_updates, add="+")
+        self.after(1000, self._fallback_poll)
 
     # drag handlers
     def _start_drag(self, event: tk.Event):
@@ -406,47 +547,75 @@ class Overlay(tk.Toplevel):
         self.configure(cursor="")
 
     def apply_style(self):
-        # Font & colors
-        font_weight = "bold" if self.settings.is_bold else "normal"
-        self.count_label.config(
-            font=("Inter", self.settings.font_size, font_weight),
-            fg=self.settings.text_color,
-            bg=self.settings.bg_color
-        )
-
-        # Opacity (whole window)
-        clamped_opacity = max(0.10, min(1.00, float(self.settings.opacity)))
-        self.wm_attributes("-alpha", clamped_opacity)
+        # Only issue the Tk calls whose value actually changed; a drag of the
+        # opacity scale then costs a single wm_attributes("-alpha") call.
+        applied = self._applied_style
 
         # Transparent BG (Windows only)
         if self.settings.is_transparent and os.name == 'nt':
             transparent_color = "#FE00FE"  # color key
-            self.config(bg=transparent_color)
-            self.wm_attributes("-transparentcolor", transparent_color)
-            self.count_label.config(bg=transparent_color)
+            bg_color = transparent_color
         else:
-            self.wm_attributes("-transparentcolor", "")
-            self.config(bg=self.settings.bg_color)
-            self.count_label.config(bg=self.settings.bg_color)
+            transparent_color = ""
+            bg_color = self.settings.bg_color
 
-    def update_count(self, new_count: int):
-        self.count_var.set(str(new_count))
+        # Font & colors
+        label_changes = {}
+        for option, value in (
+            ("font", _overlay_font(self.settings.font_size, self.settings.is_bold)),
+            ("fg", self.settings.text_color),
+            ("bg", bg_color),
+        ):
+            if applied.get(option) != value:
+                label_changes[option] = value
+                applied[option] = value
+        if label_changes:
+            self.count_label.config(**label_changes)
+
+        if applied.get("window_bg") != bg_color:
+            self.config(bg=bg_color)
+            applied["window_bg"] = bg_color
 
-    def _poll_core_updates(self):
+        # Opacity (whole window)
+        clamped_opacity = max(0.10, min(1.00, float(self.settings.opacity)))
+        if applied.get("-alpha") != clamped_opacity:
+            self.wm_attributes("-alpha", clamped_opacity)
+            applied["-alpha"] = clamped_opacity
+
+        if applied.get("-transparentcolor") != transparent_color:
+            self.wm_attributes("-transparentcolor", transparent_color)
+            applied["-transparentcolor"] = transparent_color
+
+    def update_count(self, new_count: int | str):
+        text = str(new_count)
+        if text == self._last_rendered:
+            return
+        self._last_rendered = text
+        self._tk_call(self._count_path, "configure", "-text", text)
+
+    def _fallback_poll(self):
+        # Safety net for updates whose virtual event was dropped.
+        self._drain_updates()
+        self.after(1000, self._fallback_poll)
+
+    def _drain_updates(self, _event: tk.Event | None = None):
+        # Drain everything queued since the last tick and render only the
+        # final state; intermediate counts would never be painted anyway.
+        self.core.ack_notify()
+        latest_text = None
+        pop_update = self.core.update_q.popleft
         try:
             while True:
-                update_type, value = self.core.update_q.get_nowait()
+                update_type, value = pop_update()
                 if update_type == "count":
-                    self.update_count(value)
+                    latest_text = value
                 elif update_type == "paused":
-                    self.update_count("PAUSED" if value else self.core.count)
-                elif update_type == "status":
-                    pass
-                elif update_type == "sequence_presses":
-                    pass
-        except queue.Empty:
+                    latest_text = "PAUSED" if value else self.core.count
+                # "status" / "sequence_presses" are informational only
+        except IndexError:
             pass
-        self.after(100, self._poll_core_updates)
+        if latest_text is not None:
+            self.update_count(latest_text)
 
 
 # --- UI: Control Panel Window ---
@@ -470,7 +639,7 @@ class ControlPanel(tk.Toplevel):
             pass
 
         self.configure(bg=CONTROL_BG)
-        self.option_add("*Font", ("Inter", 10))
+        self.option_add("*Font", FONT_BODY)
 
         style.configure("Main.TFrame", background=CONTROL_BG)
         style.configure("CardInner.TFrame", background=PANEL_BG)
@@ -485,7 +654,7 @@ class ControlPanel(tk.Toplevel):
             "Card.TLabelframe.Label",
             background=CONTROL_BG,
             foreground=ACCENT_COLOR,
-            font=("Inter", 11, "bold"),
+            font=FONT_CARD_TITLE,
             padding=(6, 0),
         )
         style.configure("CardBody.TFrame", background=PANEL_BG)
@@ -495,27 +664,27 @@ class ControlPanel(tk.Toplevel):
             "Header.TLabel",
             background=CONTROL_BG,
             foreground=TEXT_COLOR,
-            font=("Inter", 15, "bold"),
+            font=FONT_HEADER,
         )
         style.configure(
             "Subheader.TLabel",
             background=CONTROL_BG,
             foreground=SUBTEXT_COLOR,
-            font=("Inter", 10),
+            font=FONT_BODY,
         )
         style.configure(
             "Status.TLabel",
             background=CONTROL_BG,
             foreground=SUBTEXT_COLOR,
             padding=(12, 10),
-            font=("Inter", 9),
+            font=FONT_SMALL,
         )
         style.configure(
             "InputDisplay.TLabel",
             background="#0D1B2A",
             foreground=TEXT_COLOR,
             padding=(10, 6),
-            font=("Inter", 10, "bold"),
+            font=FONT_BODY_BOLD,
         )
 
         style.configure(
@@ -526,7 +695,7 @@ class ControlPanel(tk.Toplevel):
             borderwidth=0,
             focusthickness=3,
             focuscolor=ACCENT_COLOR,
-            font=("Inter", 10, "bold"),
+            font=FONT_BODY_BOLD,
         )
         style.map(
             "Accent.TButton",
@@ -540,7 +709,7 @@ class ControlPanel(tk.Toplevel):
             foreground=TEXT_COLOR,
             padding=(12, 8),
             borderwidth=0,
-            font=("Inter", 10),
+            font=FONT_BODY,
         )
         style.map(
             "Subtle.TButton",
@@ -552,7 +721,7 @@ class ControlPanel(tk.Toplevel):
             "Modern.TCheckbutton",
             background=PANEL_BG,
             foreground=TEXT_COLOR,
-            font=("Inter", 10),
+            font=FONT_BODY,
         )
         style.map(
             "Modern.TCheckbutton",
@@ -627,12 +796,7 @@ class ControlPanel(tk.Toplevel):
         if settings.input_type == "keyboard" and (not initial_input_name or initial_input_name.startswith("Code ")):
             initial_input_name = get_key_name_from_scan_code(settings.input_code)
         elif settings.input_type == "mouse" and (not initial_input_name or initial_input_name.startswith("Code ")):
-            mouse_map = {
-                1: "Left Click", 2: "Middle Click", 3: "Right Click",
-                4: "Thumb 1 (Back)", 5: "Thumb 2 (Forward)",
-                10: "Scroll Wheel Up", 11: "Scroll Wheel Down"
-            }
-            initial_input_name = mouse_map.get(settings.input_code, f"Mouse Code {settings.input_code}")
+            initial_input_name = MOUSE_INPUT_NAMES.get(settings.input_code, f"Mouse Code {settings.input_code}")
 
         self.input_var = tk.StringVar(value=initial_input_name)
         self.rapid_mode_var = tk.BooleanVar(value=settings.is_rapid_mode)
@@ -653,6 +817,14 @@ class ControlPanel(tk.Toplevel):
 
         self.status = tk.StringVar(value="Ready")
         self.is_capturing = False
+        self._capture_hooks: tuple[Any, Any] | None = None
+        self._apply_after_id: str | None = None
+        self._save_lock = threading.Lock()
+        # Snapshots are numbered on the Tk thread; a writer that gets the lock
+        # after a newer snapshot was written skips its stale data.
+        self._save_generation = 0
+        self._written_generation = 0
+        self._save_results: queue.Queue[str] = queue.Queue()  # status lines from writer threads
 
         self.amount_var.trace_add("write", self._on_amount_var_changed)
         self.burst_idle_var.trace_add("write", self._on_burst_idle_var_changed)
@@ -661,8 +833,8 @@ class ControlPanel(tk.Toplevel):
         self.apply_inputs()
         self.status.set("Settings loaded")
 
-        self.after(100, self._poll_core_events)
-        self.after(100, self._check_pending_apply)
+        master.bind(CORE_UPDATE_EVENT, self._drain_events, add="+")
+        self.after(1000, self._fallback_poll)
         
     def _setup_ui(self):
         main_frame = ttk.Frame(self, padding="20 20 20 16", style="Main.TFrame")
@@ -879,7 +1051,7 @@ class ControlPanel(tk.Toplevel):
         ttk.Button(
             actions_row1,
             text="Reset Count (0)",
-            command=lambda: self.core.update_settings(replace(self.settings, count=0)),
+            command=lambda: self.core.set_count(0),
             style="Subtle.TButton",
         ).pack(side=tk.LEFT, expand=True, fill=tk.X, padx=(0, 8))
         ttk.Button(
@@ -972,29 +1144,34 @@ class ControlPanel(tk.Toplevel):
 
     def _toggle_mode_labels(self, skip_apply=False):
         """Updates UI based on Rapid Mode and Idle Time settings."""
-        is_rapid = self.rapid_mode_var.get()
-        is_idle_on = self.burst_idle_var.get() > 0
-        
+        # Each Var.get() is a Tcl round-trip: read once, then work on locals.
+        self._update_mode_labels(
+            self.rapid_mode_var.get(),
+            self._get_int_from_var(self.burst_idle_var, self.settings.burst_idle_ms),
+            self._get_int_from_var(self.amount_var, self.settings.amount),
+        )
+        if not skip_apply:
+            self._apply_pending_settings()
+
+    def _update_mode_labels(self, is_rapid: bool, idle_ms: int, amount: int):
         if is_rapid:
             state = 'disabled'
             self.amount_label_var.set("Amount (N/A):")
             self.status.set("Mode: Rapid (1:1 counting)")
         else:
             state = 'normal'
-            if is_idle_on:
-                if self.amount_var.get() == 1:
+            if idle_ms > 0:
+                if amount == 1:
                     self.status.set("Mode: Burst (Count on 1st click, idle resets)")
                 else:
-                    self.status.set(f"Mode: Multi-Burst (Count on 1st click of {self.amount_var.get()}th burst)")
+                    self.status.set(f"Mode: Multi-Burst (Count on 1st click of {amount}th burst)")
                 self.amount_label_var.set("Amount (N bursts):")
             else:
-                self.status.set(f"Mode: Multi-Click (Count every {self.amount_var.get()} presses)")
+                self.status.set(f"Mode: Multi-Click (Count every {amount} presses)")
                 self.amount_label_var.set("Amount (N presses):")
         
         self.amount_spinbox.config(state=state)
         self.burst_idle_spinbox.config(state=state)
-        if not skip_apply:
-            self._apply_pending_settings()
 
     def _on_amount_var_changed(self, *_args):
         if self._trace_suspend:
@@ -1039,8 +1216,7 @@ class ControlPanel(tk.Toplevel):
         self.master.config(cursor="watch")
         self.config(cursor="watch")
 
-        keyboard.hook(self._capture_key)
-        mouse.hook(self._capture_mouse)
+        self._capture_hooks = (keyboard.hook(self._capture_key), mouse.hook(self._capture_mouse))
 
     def _end_capture(self):
         self.is_capturing = False
@@ -1048,34 +1224,34 @@ class ControlPanel(tk.Toplevel):
         self.master.config(cursor="")
         self.config(cursor="")
 
-        if HOOK_AVAILABLE:
-            keyboard.unhook_all()
-            mouse.unhook_all()
+        # Only remove our own capture hooks; unhook_all() would also drop the
+        # core's tracking hook and hotkeys.
+        if HOOK_AVAILABLE and self._capture_hooks:
+            key_capture, mouse_capture = self._capture_hooks
+            self._capture_hooks = None
+            try: keyboard.unhook(key_capture)
+            except (KeyError, ValueError): pass
+            try: mouse.unhook(mouse_capture)
+            except (KeyError, ValueError): pass
         
         self.core.update_settings(self.settings) 
 
+    # _capture_key/_capture_mouse run on the hook library threads: they only
+    # resolve the input and hand it to the Tk thread via the core's event queue.
     def _capture_key(self, event):
         if self.is_capturing and event.event_type == keyboard.KEY_DOWN:
-            self.settings.input_type = "keyboard"
-            self.settings.input_code = event.scan_code
-
+            self.is_capturing = False
             key_name = event.name
             if key_name:
                 key_name = _format_key_name(key_name)
             if not key_name:
                 key_name = get_key_name_from_scan_code(event.scan_code)
 
-            self.settings.input_display = key_name
-            self.input_var.set(key_name)
-
-            self._end_capture()
-            self._apply_pending_settings()
-            self.status.set(f"Input captured: Key '{key_name}'")
+            self.core.post_event(("captured", "keyboard", event.scan_code, key_name))
             return False
         
     def _capture_mouse(self, event):
         if self.is_capturing:
-            self.settings.input_type = "mouse"
             mouse_code = 0
             mouse_name = "Unknown"
             
@@ -1097,58 +1273,83 @@ class ControlPanel(tk.Toplevel):
                     mouse_code, mouse_name = 11, "Scroll Wheel Down"
 
             if mouse_code != 0:
-                self.settings.input_code = mouse_code
-                self.settings.input_display = mouse_name
-                self.input_var.set(mouse_name)
-                self._end_capture()
-                self._apply_pending_settings()
-                self.status.set(f"Input captured: Mouse '{mouse_name}'")
+                self.is_capturing = False
+                self.core.post_event(("captured", "mouse", mouse_code, mouse_name))
                 return False
 
-    _pending_apply_settings = False
+    def _finish_capture(self, input_type: Literal["keyboard", "mouse"], input_code: int, display: str):
+        if self._capture_hooks is None:
+            return  # the other hook thread already delivered a capture
+        self.settings.input_type = input_type
+        self.settings.input_code = input_code
+        self.settings.input_display = display
+        self.input_var.set(display)
+
+        self._end_capture()
+        self._apply_pending_settings()
+        kind = "Key" if input_type == "keyboard" else "Mouse"
+        self.status.set(f"Input captured: {kind} '{display}'")
+
+    def _cancel_pending_apply(self):
+        if self._apply_after_id is not None:
+            self.after_cancel(self._apply_after_id)
+            self._apply_after_id = None
 
     def _apply_pending_settings(self):
-        self._pending_apply_settings = True
+        # Trailing-edge debounce: a burst of edits (e.g. dragging the opacity
+        # scale) results in a single apply once the input settles.
+        self._cancel_pending_apply()
+        self._apply_after_id = self.after(250, self._do_apply)
 
-    def _check_pending_apply(self):
-        if self._pending_apply_settings:
-            self.apply_inputs()
-            self._pending_apply_settings = False
-            self.status.set("Settings updated (unsaved)")
-        self.after(200, self._check_pending_apply)
+    def _do_apply(self):
+        self._apply_after_id = None
+        self.apply_inputs()
+        self.status.set("Settings updated (unsaved)")
 
     def _apply_now(self):
+        self._cancel_pending_apply()
         self.apply_inputs()
-        self._pending_apply_settings = False
         self.status.set("Settings updated (unsaved)")
 
     def apply_inputs(self):
+        # Read every Var once up front (each .get() is a Tcl round-trip)
+        is_rapid = self.rapid_mode_var.get()
+        amount_value = self._get_int_from_var(self.amount_var, self.settings.amount)
+        idle_value = self._get_int_from_var(self.burst_idle_var, self.settings.burst_idle_ms)
+        font_size = self.font_size_var.get()
+        text_color = self.text_color_var.get()
+        bg_color = self.bg_color_var.get()
+        is_bold = self.bold_var.get()
+        is_transparent = self.transparent_var.get()
+        try:
+            opacity_percent = float(self.opacity_var.get())
+        except Exception:
+            opacity_percent = None
+
         # Tracking
-        self.settings.is_rapid_mode = self.rapid_mode_var.get()
+        self.settings.is_rapid_mode = is_rapid
 
-        amount_value = self._get_int_from_var(self.amount_var, self.settings.amount)
         sanitized_amount = max(1, amount_value)
         self.settings.amount = sanitized_amount
         if sanitized_amount != amount_value:
             self._set_int_var(self.amount_var, sanitized_amount)
 
-        idle_value = self._get_int_from_var(self.burst_idle_var, self.settings.burst_idle_ms)
         sanitized_idle = max(0, idle_value)
         self.settings.burst_idle_ms = sanitized_idle
         if sanitized_idle != idle_value:
             self._set_int_var(self.burst_idle_var, sanitized_idle)
         
         # Style updates
-        self.settings.font_size = self.font_size_var.get()
-        self.settings.text_color = self.text_color_var.get()
-        self.settings.bg_color = self.bg_color_var.get()
-        self.settings.is_bold = self.bold_var.get()
-        self.settings.is_transparent = self.transparent_var.get()
+        self.settings.font_size = font_size
+        self.settings.text_color = text_color
+        self.settings.bg_color = bg_color
+        self.settings.is_bold = is_bold
+        self.settings.is_transparent = is_transparent
         # Opacity (map 10–100% → 0.10–1.00, clamp)
-        try:
-            self.settings.opacity = max(0.10, min(1.00, float(self.opacity_var.get()) / 100.0))
-        except Exception:
+        if opacity_percent is None:
             self.settings.opacity = 0.85
+        else:
+            self.settings.opacity = max(0.10, min(1.00, opacity_percent / 100.0))
 
         # Update the input label display based on current settings
         if self.settings.input_type == "keyboard":
@@ -1157,21 +1358,12 @@ class ControlPanel(tk.Toplevel):
                 self.settings.input_display = name
             self.input_var.set(self.settings.input_display)
         elif self.settings.input_type == "mouse":
-            mouse_map = {
-                1: "Left Click",
-                2: "Middle Click",
-                3: "Right Click",
-                4: "Thumb 1 (Back)",
-                5: "Thumb 2 (Forward)",
-                10: "Scroll Wheel Up",
-                11: "Scroll Wheel Down"
-            }
-            name = mouse_map.get(self.settings.input_code, f"Code {self.settings.input_code}")
+            name = MOUSE_INPUT_NAMES.get(self.settings.input_code, f"Code {self.settings.input_code}")
             self.settings.input_display = name
             self.input_var.set(name)
         
         # Mode labels
-        self._toggle_mode_labels(skip_apply=True)
+        self._update_mode_labels(is_rapid, sanitized_idle, sanitized_amount)
 
         # Apply style to the overlay (includes opacity)
         self.overlay.apply_style()
@@ -1179,30 +1371,70 @@ class ControlPanel(tk.Toplevel):
         # Push tracking/state settings to the core thread
         self.core.update_settings(self.settings)
 
-    def save_settings(self):
+    def save_settings(self) -> threading.Thread | None:
+        """Snapshots the settings and writes them to CONFIG_FILE on a worker thread."""
         try:
             self.apply_inputs() 
-            save_data = asdict(self.settings)
-            # Don't persist volatile runtime state
-            del save_data['count']
-            del save_data['is_paused']
-
-            with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-                json.dump(save_data, f, indent=4)
-            self.status.set(f"Settings saved to {CONFIG_FILE}")
+            save_data = {name: getattr(self.settings, name) for name in SAVE_FIELDS}
         except Exception as e:
             self.status.set(f"ERROR saving settings: {e}")
+            return None
+
+        self._save_generation += 1
+        # Non-daemon so a save started during shutdown still completes.
+        writer = threading.Thread(
+            target=self._write_settings_file, args=(save_data, self._save_generation)
+        )
+        writer.start()
+        self.status.set("Saving settings...")
+        self.after(50, self._poll_save, writer)
+        return writer
+
+    def _write_settings_file(self, save_data: Dict[str, Any], generation: int):
+        tmp_file = CONFIG_FILE + ".tmp"
+        try:
+            with self._save_lock:
+                # The lock isn't FIFO: never let an older snapshot overwrite a newer one.
+                if generation > self._written_generation:
+                    with open(tmp_file, "w", encoding="utf-8") as f:
+                        json.dump(save_data, f, indent=4)
+                    os.replace(tmp_file, CONFIG_FILE)  # atomic: never leave a half-written config
+                    self._written_generation = generation
+        except Exception as e:
+            self._save_results.put(f"ERROR saving settings: {e}")
+        else:
+            self._save_results.put(f"Settings saved to {CONFIG_FILE}")
+
+    def _poll_save(self, writer: threading.Thread):
+        # Runs on the Tk thread; the writer only queues its result, so it never
+        # touches Tk (and a save during shutdown doesn't wait on the main loop).
+        if writer.is_alive():
+            self.after(50, self._poll_save, writer)
+            return
+        try:
+            while True:
+                self.status.set(self._save_results.get_nowait())
+        except queue.Empty:
+            pass
 
     # --- Events ---
-    def _poll_core_events(self):
+    def _fallback_poll(self):
+        # Safety net for events whose virtual event was dropped.
+        self._drain_events()
+        self.after(1000, self._fallback_poll)
+
+    def _drain_events(self, _event: tk.Event | None = None):
+        self.core.ack_notify()
         try:
-            msg = self.core.event_q.get_nowait()
-            if msg == "quit":
-                self.master.quit()
-                return
+            while True:
+                msg = self.core.event_q.get_nowait()
+                if msg == "quit":
+                    self.master.quit()
+                    return
+                if isinstance(msg, tuple) and msg[0] == "captured":
+                    self._finish_capture(*msg[1:])
         except queue.Empty:
             pass
-        self.after(100, self._poll_core_events)
 
     def _on_close(self):
         if messagebox.askokcancel("Quit", "Exit AURAtrac Lite?"):
@@ -1214,40 +1446,43 @@ class ControlPanel(tk.Toplevel):
 def load_or_default() -> Settings:
     """Loads settings from JSON file or returns default settings."""
     settings = Settings()
-    if os.path.exists(CONFIG_FILE):
-        try:
-            with open(CONFIG_FILE, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            if 'group_n' in data:
-                data['amount'] = data.pop('group_n')
-            for k, v in data.items():
-                if hasattr(settings, k):
-                    setattr(settings, k, v)
-            settings.amount = max(1, settings.amount)
-            # Clamp opacity if coming from older/odd files
-            try:
-                settings.opacity = max(0.10, min(1.00, float(settings.opacity)))
-            except Exception:
-                settings.opacity = 0.85
-            if settings.input_type == "keyboard":
-                resolved = get_key_name_from_scan_code(settings.input_code)
-                if not settings.input_display or settings.input_display.startswith("Code "):
-                    settings.input_display = resolved
-            elif settings.input_type == "mouse":
-                mouse_map = {
-                    1: "Left Click",
-                    2: "Middle Click",
-                    3: "Right Click",
-                    4: "Thumb 1 (Back)",
-                    5: "Thumb 2 (Forward)",
-                    10: "Scroll Wheel Up",
-                    11: "Scroll Wheel Down"
-                }
-                if not settings.input_display:
-                    settings.input_display = mouse_map.get(settings.input_code, f"Code {settings.input_code}")
-            return settings
-        except Exception:
-            print(f"Warning: Could not load or parse {CONFIG_FILE}. Using default settings.")
+    # EAFP: a missing config costs one failed open() instead of a stat + open.
+    try:
+        with open(CONFIG_FILE, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if 'group_n' in data:
+            data['amount'] = data.pop('group_n')
+        # Single pass over the schema: unknown keys in the file are ignored,
+        # ints/floats are converted to the expected numeric type and any other
+        # mistyped value falls back to the default instead of reaching the
+        # hook thread.
+        for name, (expected, default) in SETTINGS_SCHEMA.items():
+            value = data.get(name, default)
+            if type(value) is not expected:
+                is_number = isinstance(value, (int, float)) and not isinstance(value, bool)
+                if is_number and expected in (int, float):
+                    try:
+                        value = expected(value)
+                    except (TypeError, ValueError, OverflowError):  # e.g. 1e999 or NaN -> int
+                        value = default
+                else:
+                    value = default
+            setattr(settings, name, value)
+        settings.amount = max(1, settings.amount)
+        # Clamp opacity if coming from older/odd files (already a float here)
+        settings.opacity = max(0.10, min(1.00, settings.opacity))
+        if settings.input_type == "keyboard":
+            resolved = get_key_name_from_scan_code(settings.input_code)
+            if not settings.input_display or settings.input_display.startswith("Code "):
+                settings.input_display = resolved
+        elif settings.input_type == "mouse":
+            if not settings.input_display:
+                settings.input_display = MOUSE_INPUT_NAMES.get(settings.input_code, f"Code {settings.input_code}")
+        return settings
+    except FileNotFoundError:
+        pass
+    except Exception:
+        log.warning("Warning: Could not load or parse %s. Using default settings.", CONFIG_FILE)
     if not settings.input_display:
         if settings.input_type == "keyboard":
             settings.input_display = get_key_name_from_scan_code(settings.input_code)
@@ -1256,52 +1491,78 @@ def load_or_default() -> Settings:
     return settings
 
 
-def main():
-    if HOOK_AVAILABLE:
-        try:
-            if os.name == 'nt':
-                 pass
-            elif os.getuid() != 0:
-                print("Note: Running without Administrator privileges. Global hooks may be unreliable in fullscreen applications.")
-        except AttributeError:
-            pass
-
-    settings = load_or_default()
-    core = CounterCore(settings)
+@functools.lru_cache(maxsize=None)
+def _get_primary_screen_width() -> int | None:
+    """Primary monitor width from pywin32 (imported on first use), or None off Windows."""
+    if os.name != 'nt':
+        return None
+    try:
+        import win32api
+    except ImportError:
+        return None
+    return win32api.GetSystemMetrics(0)
 
-    root = tk.Tk()
-    root.withdraw()
 
+def _show_overlay(root: tk.Tk, core: CounterCore, settings: Settings) -> tuple[Overlay, int]:
+    """Phase 1: creates and positions the overlay; returns it with its x position."""
     overlay = Overlay(root, core, settings)
 
     root_x = 100
     root_y = 100
-    if os.name == 'nt':
-        try:
-            import win32api 
-            root_x = win32api.GetSystemMetrics(0) // 2 - 200
-        except ImportError:
-            pass
+    screen_width = _get_primary_screen_width()
+    if screen_width:
+        root_x = screen_width // 2 - 200
 
     overlay.geometry(f"+{root_x}+{root_y}")
+    return overlay, root_x
 
+
+def _build_control_panel(root: tk.Tk, core: CounterCore, settings: Settings,
+                         overlay: Overlay, control_x: int) -> ControlPanel:
+    """Phase 2: creates the control panel next to the overlay."""
     control = ControlPanel(root, core, settings, overlay)
-    
-    control.update_idletasks()
-    control_x = root_x + overlay.winfo_width() + 50
     control.geometry(f"+{control_x}+100")
-
-    core.start()
-    
     root.protocol("WM_DELETE_WINDOW", control._on_close)
+    return control
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    if HOOK_AVAILABLE and NEEDS_ROOT_WARNING:
+        log.info("Note: Running without Administrator privileges. Global hooks may be unreliable in fullscreen applications.")
+
+    settings = load_or_default()
+    core = CounterCore(settings)
+
+    root = tk.Tk()
+    root.withdraw()
+    core.attach_root(root)
+
+    overlay, root_x = _show_overlay(root, core, settings)
+
+    # Phase 2: the overlay's map request is already queued, so building the
+    # control panel from the idle queue keeps it off the overlay's critical path.
+    control: ControlPanel | None = None
+
+    def build_control_panel():
+        nonlocal control
+        control = _build_control_panel(root, core, settings, overlay, root_x + overlay.width + 50)
+
+    root.after_idle(build_control_panel)
+    # Start the core (and install its hooks) after the control panel is built;
+    # both run in the same idle pass, before the panel is mapped.
+    root.after_idle(core.start)
 
     try:
         root.mainloop()
     finally:
+        # Let the core drain while the settings file is written.
         core.stop()
+        writer = control.save_settings() if control is not None else None
         if core.is_alive():
             core.join(timeout=1.0)
-        control.save_settings()
+        if writer is not None:
+            writer.join(timeout=1.0)
 
 
 if __name__ == "__main__":